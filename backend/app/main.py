@@ -5,6 +5,7 @@ Main FastAPI application factory.
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from app import database
@@ -42,7 +43,9 @@ def create_app() -> FastAPI:
         title="Excavation Monitoring System API",
         description="AI-powered mining excavation monitoring with real-time alerts",
         version="1.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        # orjson with OPT_SERIALIZE_NUMPY, so ndarray coordinates encode in C
+        default_response_class=ORJSONResponse
     )
 
     # ========================================================================
@@ -3,7 +3,7 @@ Database models for excavation monitoring system.
 Uses SQLAlchemy ORM with PostGIS spatial extensions.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean, Text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from geoalchemy2 import Geometry
@@ -21,6 +21,8 @@ class AoI(Base):
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text)
     geometry = Column(Geometry('POLYGON', srid=4326), nullable=False)
+    # GeoJSON copy of geometry, maintained by a database trigger (see database.init_db)
+    geometry_geojson = Column(JSONB, server_default=FetchedValue(), server_onupdate=FetchedValue())
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -34,6 +36,8 @@ class MinerBoundary(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text)
     geometry = Column(Geometry('POLYGON', srid=4326), nullable=False)
+    # GeoJSON copy of geometry, maintained by a database trigger (see database.init_db)
+    geometry_geojson = Column(JSONB, server_default=FetchedValue(), server_onupdate=FetchedValue())
     is_legal = Column(Boolean, default=True)  # True for legal, False for no-go zones
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
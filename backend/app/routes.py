@@ -3,36 +3,85 @@ REST API endpoints for excavation monitoring system.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Request
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry import shape
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, File, UploadFile, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, cast, case, select, true
+from sqlalchemy.dialects.postgresql import JSONB
+from geoalchemy2 import Geography
 
 from app import models, schemas, database
 from app.websocket import manager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["excavation-monitoring"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["excavation-monitoring"],
+    default_response_class=ORJSONResponse
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized for frequently requested AOI IDs"""
+    return UUID(value)
 
 
 # Helper function to resolve AOI ID
 def resolve_aoi_id(aoi_id: str, db: Session) -> UUID:
     """Convert aoi_id string to UUID, handling special 'default-aoi' case"""
     if aoi_id == "default-aoi":
-        first_aoi = db.query(models.AoI).first()
-        if not first_aoi:
+        first_aoi_id = db.execute(
+            select(models.AoI.id).order_by(models.AoI.created_at).limit(1)
+        ).scalar()
+        if not first_aoi_id:
             raise HTTPException(status_code=404, detail="No AOI found in database")
-        return first_aoi.id
+        return first_aoi_id
     try:
-        return UUID(aoi_id)
+        return _parse_uuid(aoi_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid AOI ID format")
 
 
+def aoi_uuid_dep(aoi_id: str, db: Session = Depends(database.get_db)) -> UUID:
+    """Dependency resolving the `aoi_id` path parameter once per request"""
+    return resolve_aoi_id(aoi_id, db)
+
+
+def validate_polygon_ring(geometry: Optional[dict]) -> np.ndarray:
+    """Validate a GeoJSON polygon's exterior ring and return it as an (N, 2) array"""
+    try:
+        ring = np.asarray(geometry['coordinates'][0], dtype=np.float64)
+    except (TypeError, KeyError, IndexError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid polygon coordinates")
+
+    if ring.ndim != 2 or ring.shape[1] != 2 or ring.shape[0] < 4:
+        raise HTTPException(
+            status_code=400,
+            detail="Polygon ring must contain at least 4 [lon, lat] pairs"
+        )
+
+    lon, lat = ring[:, 0], ring[:, 1]
+    # NaN compares False, so non-finite values are rejected here as well
+    if not ((-180 <= lon) & (lon <= 180) & (-90 <= lat) & (lat <= 90)).all():
+        raise HTTPException(status_code=400, detail="Polygon coordinates out of range")
+
+    if not np.array_equal(ring[0], ring[-1]):
+        raise HTTPException(status_code=400, detail="Polygon ring is not closed")
+
+    return ring
+
+
 # ============================================================================
 # AOI Endpoints
 # ============================================================================
@@ -47,12 +96,12 @@ def create_aoi(
     logger.info(f"📍 [AOI:CREATE] Received request to create AOI")
     logger.info(f"📍 [AOI:CREATE]   Name: {aoi.name}")
     logger.info(f"📍 [AOI:CREATE]   Description: {aoi.description}")
-    logger.info(f"📍 [AOI:CREATE]   Geometry Type: {aoi.geometry.get('type') if aoi.geometry else 'None'}")
-    
-    if aoi.geometry:
-        coords = aoi.geometry.get('coordinates', [[]])
-        logger.info(f"📍 [AOI:CREATE]   Coordinate Points: {len(coords[0]) if coords else 0}")
-        logger.info(f"📍 [AOI:CREATE]   First Point: {coords[0][0] if coords and coords[0] else 'N/A'}")
+
+    # Reject malformed geometry before anything else inspects it
+    ring = validate_polygon_ring(aoi.geometry)
+    logger.info(f"📍 [AOI:CREATE]   Geometry Type: {aoi.geometry.get('type')}")
+    logger.info(f"📍 [AOI:CREATE]   Coordinate Points: {len(ring)}")
+    logger.info(f"📍 [AOI:CREATE]   First Point: {ring[0].tolist()}")
     
     # Check if AOI with this name already exists
     logger.info(f"📍 [AOI:CREATE] Checking for duplicate AOI name...")
@@ -67,8 +116,7 @@ def create_aoi(
 
     # Convert GeoJSON coordinates to WKT format
     logger.info(f"📍 [AOI:CREATE] Converting GeoJSON to WKT format...")
-    coords = aoi.geometry['coordinates'][0]
-    wkt_coords = ", ".join([f"{lon} {lat}" for lon, lat in coords])
+    wkt_coords = ", ".join([f"{lon} {lat}" for lon, lat in ring.tolist()])
     wkt_string = f"SRID=4326;POLYGON(({wkt_coords}))"
     logger.info(f"📍 [AOI:CREATE] ✓ WKT Generated: {wkt_string[:80]}...")
     
@@ -104,18 +152,19 @@ def list_aois(
     logger.info(f"📋 [AOI:LIST] ✓ Retrieved {len(aois)} AOIs")
     logger.info(f"📋 [AOI:LIST] ========== SUCCESS ==========")
     
-    # Convert to response format, excluding complex geometry
-    return [
-        {
-            "id": aoi.id,
-            "name": aoi.name,
-            "description": aoi.description,
-            "geometry": None,  # Geometry excluded for simplicity
-            "created_at": aoi.created_at,
-            "updated_at": aoi.updated_at
-        }
+    # Convert to response format, excluding complex geometry; orjson encodes
+    # the slotted dataclasses directly, skipping per-field Pydantic validation
+    return ORJSONResponse([
+        schemas.AoIOut(
+            id=aoi.id,
+            name=aoi.name,
+            description=aoi.description,
+            geometry=None,  # Geometry excluded for simplicity
+            created_at=aoi.created_at,
+            updated_at=aoi.updated_at
+        )
         for aoi in aois
-    ]
+    ])
 
 
 @router.get("/aoi/{aoi_id}", response_model=schemas.AoI)
@@ -127,14 +176,31 @@ def get_aoi(
     logger.info(f"📍 [AOI:GET] ========== START ==========")
     logger.info(f"📍 [AOI:GET] Fetching AOI with ID: {aoi_id}")
     
-    db_aoi = db.query(models.AoI).filter(models.AoI.id == aoi_id).first()
-    if not db_aoi:
+    # Use the trigger-maintained GeoJSON, or let PostGIS emit it for legacy rows,
+    # instead of decoding EWKB in Python
+    row = (
+        db.query(
+            models.AoI.id,
+            models.AoI.name,
+            models.AoI.description,
+            func.coalesce(
+                models.AoI.geometry_geojson,
+                cast(func.ST_AsGeoJSON(models.AoI.geometry, database.GEOJSON_MAX_DECIMALS), JSONB)
+            ).label("geometry"),
+            models.AoI.created_at,
+            models.AoI.updated_at,
+        )
+        .filter(models.AoI.id == aoi_id)
+        .one_or_none()
+    )
+    if not row:
         logger.warning(f"📍 [AOI:GET] ❌ AOI not found (ID: {aoi_id})")
         raise HTTPException(status_code=404, detail="AOI not found")
     
+    db_aoi = schemas.AoIRecord(**row._asdict())
     logger.info(f"📍 [AOI:GET] ✓ Found AOI")
-    logger.info(f"📍 [AOI:GET]   Name: {db_aoi.name}")
-    logger.info(f"📍 [AOI:GET]   Description: {db_aoi.description}")
+    logger.info(f"📍 [AOI:GET]   Name: {db_aoi['name']}")
+    logger.info(f"📍 [AOI:GET]   Description: {db_aoi['description']}")
     logger.info(f"📍 [AOI:GET] ========== SUCCESS ==========")
     return db_aoi
 
@@ -165,9 +231,9 @@ def create_boundary(
 
     # Convert GeoJSON coordinates to WKT format
     logger.info(f"🧱 [BOUNDARY:CREATE] Converting GeoJSON to WKT format...")
-    coords = boundary.geometry['coordinates'][0]
-    logger.info(f"🧱 [BOUNDARY:CREATE]   Coordinate points: {len(coords)}")
-    wkt_coords = ", ".join([f"{lon} {lat}" for lon, lat in coords])
+    ring = validate_polygon_ring(boundary.geometry)
+    logger.info(f"🧱 [BOUNDARY:CREATE]   Coordinate points: {len(ring)}")
+    wkt_coords = ", ".join([f"{lon} {lat}" for lon, lat in ring.tolist()])
     wkt_string = f"SRID=4326;POLYGON(({wkt_coords}))"
     logger.info(f"🧱 [BOUNDARY:CREATE] ✓ WKT Generated: {wkt_string[:80]}...")
 
@@ -193,21 +259,16 @@ def create_boundary(
 
 @router.get("/boundaries/{aoi_id}", response_model=List[schemas.Boundary])
 def list_boundaries(
-    aoi_id: str,
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
     db: Session = Depends(database.get_db)
 ):
     """List all boundaries for an AOI"""
     logger.info(f"🧱 [BOUNDARY:LIST] ========== START ==========")
-    logger.info(f"🧱 [BOUNDARY:LIST] Fetching boundaries for AOI: {aoi_id}")
-    
-    # Resolve AOI ID (handles 'default-aoi' special case)
-    logger.info(f"🧱 [BOUNDARY:LIST] Resolving AOI ID...")
-    aoi_id_uuid = resolve_aoi_id(aoi_id, db)
-    logger.info(f"🧱 [BOUNDARY:LIST] ✓ Resolved UUID: {aoi_id_uuid}")
+    logger.info(f"🧱 [BOUNDARY:LIST] Fetching boundaries for AOI: {aoi_uuid}")
     
     boundaries = (
         db.query(models.MinerBoundary)
-        .filter(models.MinerBoundary.aoi_id == aoi_id_uuid)
+        .filter(models.MinerBoundary.aoi_id == aoi_uuid)
         .all()
     )
     
@@ -216,104 +277,212 @@ def list_boundaries(
     nogo_count = len(boundaries) - legal_count
     logger.info(f"🧱 [BOUNDARY:LIST]   Legal boundaries: {legal_count}")
     logger.info(f"🧱 [BOUNDARY:LIST]   No-Go zones: {nogo_count}")
+
+    # Only legacy rows without a precomputed geometry_geojson need WKB decoding;
+    # convert those in one batch
+    legacy = [b for b in boundaries if b.geometry_geojson is None]
+    converted = dict(zip(
+        [b.id for b in legacy],
+        schemas.wkb_list_to_geojson([b.geometry for b in legacy])
+    ))
+
+    # orjson encodes the slotted dataclasses directly, skipping Pydantic
+    results = [
+        schemas.BoundaryOut(
+            id=b.id,
+            aoi_id=b.aoi_id,
+            name=b.name,
+            description=b.description,
+            geometry=b.geometry_geojson if b.geometry_geojson is not None else converted[b.id],
+            is_legal=b.is_legal,
+            created_at=b.created_at,
+            updated_at=b.updated_at
+        )
+        for b in boundaries
+    ]
+
     logger.info(f"🧱 [BOUNDARY:LIST] ========== SUCCESS ==========")
-    return boundaries
+    return ORJSONResponse(results)
 
 
 # ============================================================================
 # Time-Series Data Endpoints
 # ============================================================================
 
-@router.get("/timeseries/{aoi_id}", response_model=schemas.TimeSeriesResponse)
+TIMESERIES_COLUMNS = (
+    "timestamp",
+    "excavated_area_ha",
+    "smoothed_area_ha",
+    "excavation_rate_ha_day",
+    "anomaly_score",
+    "confidence",
+)
+
+
+def _to_columns(rows) -> dict:
+    """Transpose row tuples into parallel column lists keyed by TIMESERIES_COLUMNS"""
+    if not rows:
+        return {name: [] for name in TIMESERIES_COLUMNS}
+    return dict(zip(TIMESERIES_COLUMNS, map(list, zip(*rows))))
+
+
+@router.get("/timeseries/{aoi_id}", response_model=None)
 def get_timeseries(
-    aoi_id: str,
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
     boundary_id: Optional[UUID] = None,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     db: Session = Depends(database.get_db)
 ):
     """Get time-series excavation data for an AOI"""
-    # Resolve AOI ID (handles 'default-aoi' special case)
-    aoi_id_uuid = resolve_aoi_id(aoi_id, db)
-    
-    # Get legal boundary data (join with boundaries to filter by is_legal)
-    legal_query = (
-        db.query(models.ExcavationTimeSeries)
-        .join(models.MinerBoundary, models.ExcavationTimeSeries.boundary_id == models.MinerBoundary.id)
-        .filter(
-            models.ExcavationTimeSeries.aoi_id == aoi_id_uuid,
-            models.MinerBoundary.is_legal == True
+    ts = models.ExcavationTimeSeries
+    columns = [getattr(ts, name) for name in TIMESERIES_COLUMNS]
+
+    def series_for(is_legal: bool):
+        # Select bare column tuples (join with boundaries to filter by is_legal)
+        stmt = (
+            select(*columns)
+            .join(models.MinerBoundary, ts.boundary_id == models.MinerBoundary.id)
+            .where(ts.aoi_id == aoi_uuid, models.MinerBoundary.is_legal == is_legal)
         )
-    )
-
-    # Get no-go zone data (join with boundaries to filter by is_legal)
-    nogo_query = (
-        db.query(models.ExcavationTimeSeries)
-        .join(models.MinerBoundary, models.ExcavationTimeSeries.boundary_id == models.MinerBoundary.id)
-        .filter(
-            models.ExcavationTimeSeries.aoi_id == aoi_id_uuid,
-            models.MinerBoundary.is_legal == False
+        if start_date:
+            stmt = stmt.where(ts.timestamp >= start_date)
+        if end_date:
+            stmt = stmt.where(ts.timestamp <= end_date)
+        return _to_columns(db.execute(stmt.order_by(ts.timestamp)).all())
+
+    legal_series = series_for(True)
+    nogo_series = series_for(False)
+
+    # Aggregate max/mean per boundary type in SQL rather than rescanning the rows
+    stats_query = (
+        db.query(
+            models.MinerBoundary.is_legal,
+            func.max(models.ExcavationTimeSeries.excavated_area_ha),
+            func.avg(models.ExcavationTimeSeries.excavated_area_ha)
         )
+        .join(models.MinerBoundary, models.ExcavationTimeSeries.boundary_id == models.MinerBoundary.id)
+        .filter(models.ExcavationTimeSeries.aoi_id == aoi_uuid)
     )
-
     if start_date:
-        legal_query = legal_query.filter(models.ExcavationTimeSeries.timestamp >= start_date)
-        nogo_query = nogo_query.filter(models.ExcavationTimeSeries.timestamp >= start_date)
-
+        stats_query = stats_query.filter(models.ExcavationTimeSeries.timestamp >= start_date)
     if end_date:
-        legal_query = legal_query.filter(models.ExcavationTimeSeries.timestamp <= end_date)
-        nogo_query = nogo_query.filter(models.ExcavationTimeSeries.timestamp <= end_date)
-
-    legal_data = legal_query.order_by(models.ExcavationTimeSeries.timestamp).all()
-    nogo_data = nogo_query.order_by(models.ExcavationTimeSeries.timestamp).all()
-
-    # Convert to response format
-    legal_points = [
-        schemas.TimeSeriesDataPoint(
-            timestamp=d.timestamp,
-            excavated_area_ha=d.excavated_area_ha,
-            smoothed_area_ha=d.smoothed_area_ha,
-            excavation_rate_ha_day=d.excavation_rate_ha_day,
-            anomaly_score=d.anomaly_score,
-            confidence=d.confidence
-        )
-        for d in legal_data
-    ]
-
-    nogo_points = [
-        schemas.TimeSeriesDataPoint(
-            timestamp=d.timestamp,
-            excavated_area_ha=d.excavated_area_ha,
-            smoothed_area_ha=d.smoothed_area_ha,
-            excavation_rate_ha_day=d.excavation_rate_ha_day,
-            anomaly_score=d.anomaly_score,
-            confidence=d.confidence
-        )
-        for d in nogo_data
-    ]
+        stats_query = stats_query.filter(models.ExcavationTimeSeries.timestamp <= end_date)
+    stats = {
+        is_legal: (max_ha, mean_ha)
+        for is_legal, max_ha, mean_ha in stats_query.group_by(models.MinerBoundary.is_legal).all()
+    }
 
-    # Compute summary stats
+    legal_max, legal_mean = stats.get(True, (0, 0))
+    nogo_max, nogo_mean = stats.get(False, (0, 0))
     summary_stats = {
-        "legal_max_ha": max([p.excavated_area_ha for p in legal_points], default=0),
-        "legal_mean_ha": sum([p.excavated_area_ha for p in legal_points], 0) / len(legal_points) if legal_points else 0,
-        "nogo_max_ha": max([p.excavated_area_ha for p in nogo_points], default=0),
-        "nogo_mean_ha": sum([p.excavated_area_ha for p in nogo_points], 0) / len(nogo_points) if nogo_points else 0,
+        "legal_max_ha": legal_max,
+        "legal_mean_ha": float(legal_mean),
+        "nogo_max_ha": nogo_max,
+        "nogo_mean_ha": float(nogo_mean),
     }
 
-    return schemas.TimeSeriesResponse(
-        legal_boundary=legal_points,
-        nogo_zones=nogo_points,
-        summary_stats=summary_stats
+    return ORJSONResponse({
+        "legal_boundary": legal_series,
+        "nogo_zones": nogo_series,
+        "summary_stats": summary_stats
+    })
+
+
+@router.get("/timeseries/{aoi_id}/stream", response_class=StreamingResponse)
+def stream_timeseries(
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None)
+):
+    """Stream time-series excavation data for an AOI as NDJSON (one point per line)"""
+    stmt = (
+        select(
+            models.ExcavationTimeSeries.timestamp,
+            models.ExcavationTimeSeries.boundary_id,
+            models.MinerBoundary.is_legal,
+            models.ExcavationTimeSeries.excavated_area_ha,
+            models.ExcavationTimeSeries.smoothed_area_ha,
+            models.ExcavationTimeSeries.excavation_rate_ha_day,
+            models.ExcavationTimeSeries.anomaly_score,
+            models.ExcavationTimeSeries.confidence
+        )
+        .join(models.MinerBoundary, models.ExcavationTimeSeries.boundary_id == models.MinerBoundary.id)
+        .where(models.ExcavationTimeSeries.aoi_id == aoi_uuid)
+        .order_by(models.ExcavationTimeSeries.timestamp)
+        .execution_options(stream_results=True, yield_per=1000)
     )
+    if start_date:
+        stmt = stmt.where(models.ExcavationTimeSeries.timestamp >= start_date)
+    if end_date:
+        stmt = stmt.where(models.ExcavationTimeSeries.timestamp <= end_date)
+
+    def generate_rows():
+        # Own session so the server-side cursor outlives the request dependencies
+        db = database.SessionLocal()
+        try:
+            for row in db.execute(stmt):
+                yield orjson.dumps(row._asdict()) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate_rows(), media_type="application/x-ndjson")
 
 
 # ============================================================================
 # Violation Endpoints
 # ============================================================================
 
+def validate_mask_geometry(geometry: dict) -> bytes:
+    """Validate a GeoJSON excavation mask and return it as WKB"""
+    try:
+        mask = shape(geometry)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid mask geometry")
+
+    if mask.geom_type not in ("Polygon", "MultiPolygon") or mask.is_empty:
+        raise HTTPException(status_code=400, detail="Mask geometry must be a non-empty (Multi)Polygon")
+    if not mask.is_valid:
+        raise HTTPException(status_code=400, detail="Mask geometry is not a valid polygon")
+
+    return shapely.to_wkb(mask)
+
+
+def find_nogo_zone_hits(db: Session, aoi_id: UUID, mask_geometry: dict) -> dict:
+    """Return {no-go zone id: overlap area in ha} for the zones a GeoJSON mask intersects"""
+    mask_wkb = validate_mask_geometry(mask_geometry)
+    # Build the mask geometry once in a materialized CTE and reference it from
+    # every predicate, rather than re-parsing it for each candidate zone
+    mask_cte = (
+        select(func.ST_GeomFromWKB(mask_wkb, 4326).label("geom"))
+        .cte("mask")
+        .prefix_with("MATERIALIZED")
+    )
+    mask = mask_cte.c.geom
+    zone = models.MinerBoundary.geometry
+    # Skip the expensive ST_Intersection when the mask lies wholly inside the zone
+    overlap = case(
+        (func.ST_CoveredBy(mask, zone), mask),
+        else_=func.ST_Intersection(mask, zone)
+    )
+    area_ha = func.ST_Area(cast(overlap, Geography(srid=4326))) / 10000.0
+    rows = (
+        db.query(models.MinerBoundary.id, area_ha)
+        .join(mask_cte, true())
+        .filter(
+            models.MinerBoundary.aoi_id == aoi_id,
+            models.MinerBoundary.is_legal == False,
+            zone.op("&&")(mask),  # GiST bbox prefilter
+            func.ST_Intersects(zone, mask)
+        )
+        .all()
+    )
+    return {zone_id: area_ha for zone_id, area_ha in rows}
+
+
 @router.get("/violations/{aoi_id}", response_model=List[schemas.ViolationEvent])
 def get_violations(
-    aoi_id: str,
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
     severity: Optional[str] = Query(None),
     unresolved_only: bool = Query(False),
     skip: int = Query(0, ge=0),
@@ -321,10 +490,7 @@ def get_violations(
     db: Session = Depends(database.get_db)
 ):
     """Get violation events for an AOI"""
-    # Resolve AOI ID (handles 'default-aoi' special case)
-    aoi_id_uuid = resolve_aoi_id(aoi_id, db)
-    
-    query = db.query(models.ViolationEvent).filter(models.ViolationEvent.aoi_id == aoi_id_uuid)
+    query = db.query(models.ViolationEvent).filter(models.ViolationEvent.aoi_id == aoi_uuid)
 
     if severity:
         query = query.filter(models.ViolationEvent.severity == severity)
@@ -344,11 +510,25 @@ def get_violations(
 
 
 @router.post("/violations", response_model=schemas.ViolationEvent, status_code=201)
-async def create_violation(
+def create_violation(
     violation: schemas.ViolationEventCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(database.get_db)
 ):
     """Create a new violation event and broadcast alert"""
+    event_metadata = violation.event_metadata
+    if violation.mask_geometry:
+        hits = find_nogo_zone_hits(db, violation.aoi_id, violation.mask_geometry)
+        if violation.nogo_zone_id not in hits:
+            raise HTTPException(
+                status_code=400,
+                detail="Excavation mask does not intersect the given no-go zone"
+            )
+        event_metadata = {
+            **(event_metadata or {}),
+            "intersection_area_ha": hits[violation.nogo_zone_id]
+        }
+
     db_violation = models.ViolationEvent(
         aoi_id=violation.aoi_id,
         nogo_zone_id=violation.nogo_zone_id,
@@ -357,7 +537,7 @@ async def create_violation(
         excavated_area_ha=violation.excavated_area_ha,
         description=violation.description,
         severity=violation.severity or "MEDIUM",
-        event_metadata=violation.event_metadata
+        event_metadata=event_metadata
     )
     db.add(db_violation)
     db.commit()
@@ -374,12 +554,14 @@ async def create_violation(
         description=db_violation.description or ""
     )
 
-    await manager.broadcast_violation(
+    # Fan out to WebSocket subscribers after the response has been sent
+    background_tasks.add_task(
+        manager.broadcast_violation,
         str(violation.aoi_id),
-        alert.dict()
+        alert.model_dump(mode="json")
     )
 
-    logger.info(f"Created and broadcasted violation: {db_violation.id}")
+    logger.info(f"Created violation and scheduled broadcast: {db_violation.id}")
     return db_violation
 
 
@@ -437,16 +619,13 @@ def create_analysis_config(
 
 @router.get("/analysis-configs/{aoi_id}", response_model=List[schemas.AnalysisConfig])
 def list_analysis_configs(
-    aoi_id: str,
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
     db: Session = Depends(database.get_db)
 ):
     """List all analysis configs for an AOI"""
-    # Resolve AOI ID (handles 'default-aoi' special case)
-    aoi_id_uuid = resolve_aoi_id(aoi_id, db)
-    
     configs = (
         db.query(models.AnalysisConfig)
-        .filter(models.AnalysisConfig.aoi_id == aoi_id_uuid)
+        .filter(models.AnalysisConfig.aoi_id == aoi_uuid)
         .order_by(desc(models.AnalysisConfig.created_at))
         .all()
     )
@@ -572,16 +751,13 @@ def create_subscription(
 
 @router.get("/subscriptions/{aoi_id}", response_model=List[schemas.AlertSubscription])
 def list_subscriptions(
-    aoi_id: str,
+    aoi_uuid: UUID = Depends(aoi_uuid_dep),
     db: Session = Depends(database.get_db)
 ):
     """List subscriptions for an AOI"""
-    # Resolve AOI ID (handles 'default-aoi' special case)
-    aoi_id_uuid = resolve_aoi_id(aoi_id, db)
-    
     subs = (
         db.query(models.AlertSubscription)
-        .filter(models.AlertSubscription.aoi_id == aoi_id_uuid)
+        .filter(models.AlertSubscription.aoi_id == aoi_uuid)
         .all()
     )
     return subs
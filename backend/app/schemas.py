@@ -2,125 +2,190 @@
 Pydantic schemas for request/response validation.
 """
 
-from pydantic import BaseModel, Field, validator, field_serializer, model_serializer
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, validator, field_serializer
+from typing import Optional, List, Dict, Any, Tuple, TypedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from collections import OrderedDict
+import hashlib
+import threading
 from uuid import UUID
 import json
 import logging
+import numpy as np
+import shapely
 from shapely import wkb
-from shapely.geometry import shape
+from shapely.geometry import mapping, shape
 
 logger = logging.getLogger(__name__)
 
 
+def _geometry_to_geojson(geom) -> Dict[str, Any]:
+    """Convert a shapely geometry to a GeoJSON dict"""
+    # For Polygon, return as nested list of coordinate pairs [lng, lat]
+    if geom.geom_type == "Polygon":
+        # Pull every ring's vertices out in one C call, then cut the (N, 2)
+        # buffer at the ring boundaries (exterior first, then any holes)
+        coords, ring_index = shapely.get_coordinates(shapely.get_rings(geom), return_index=True)
+        ring_ends = np.flatnonzero(np.diff(ring_index)) + 1
+        # Rings stay as ndarrays; orjson (OPT_SERIALIZE_NUMPY) encodes them in C
+        coordinates = np.split(coords, ring_ends)
+        
+        return {
+            "type": "Polygon",
+            "coordinates": coordinates
+        }
+    
+    # For Point
+    elif geom.geom_type == "Point":
+        return {
+            "type": "Point",
+            "coordinates": [geom.x, geom.y]
+        }
+    
+    # For LineString
+    elif geom.geom_type == "LineString":
+        return {
+            "type": "LineString",
+            "coordinates": shapely.get_coordinates(geom)
+        }
+    
+    # For other types, convert using shapely's mapping
+    else:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Geometry type '{geom.geom_type}' not specifically handled, using shapely mapping")
+        return mapping(geom)
+
+
+def _freeze(value):
+    """Recursively turn lists into tuples so cached results can be shared safely"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    return value
+
+
+def _thaw(value):
+    """Recursively turn tuples and ndarrays back into plain lists for Pydantic"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _thaw(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Parsed geometries keyed by a short WKB digest, so multi-MB polygons aren't
+# pinned in memory as cache keys alongside their coordinate arrays
+_GEOJSON_CACHE_SIZE = 256
+_geojson_cache: "OrderedDict[bytes, Tuple[Tuple[str, Any], ...]]" = OrderedDict()
+# Sync endpoints run in FastAPI's threadpool, so every cache access is locked
+_geojson_cache_lock = threading.Lock()
+
+
+def _wkb_bytes_to_geojson(data) -> Tuple[Tuple[str, Any], ...]:
+    """Parse WKB bytes once per distinct geometry, returning immutable GeoJSON items"""
+    key = hashlib.blake2b(data, digest_size=8).digest()
+    with _geojson_cache_lock:
+        cached = _geojson_cache.get(key)
+        if cached is not None:
+            _geojson_cache.move_to_end(key)
+            return cached
+
+    # Parse outside the lock; a concurrent miss on the same key just parses twice
+    cached = tuple((k, _freeze(v)) for k, v in _geometry_to_geojson(wkb.loads(bytes(data))).items())
+    with _geojson_cache_lock:
+        _geojson_cache[key] = cached
+        _geojson_cache.move_to_end(key)
+        if len(_geojson_cache) > _GEOJSON_CACHE_SIZE:
+            _geojson_cache.popitem(last=False)
+    return cached
+
+
 def wkb_to_geojson(wkb_element) -> Optional[Dict[str, Any]]:
     """Convert WKBElement from PostGIS to GeoJSON"""
-    logger.info(f"🔄 [GEOMETRY:CONVERT] ========== START ==========")
-    
     if wkb_element is None:
-        logger.warning(f"🔄 [GEOMETRY:CONVERT] ⚠️  Received None WKB element")
         return None
     
+    # Already GeoJSON (e.g. produced by ST_AsGeoJSON in the query)
+    if isinstance(wkb_element, dict):
+        return wkb_element
+    
     try:
-        logger.info(f"🔄 [GEOMETRY:CONVERT] Input type: {type(wkb_element).__name__}")
-        
-        # Handle WKBElement from geoalchemy2
+        # Handle WKBElement from geoalchemy2; the column result processor always
+        # yields the driver's bytea value (bytes or memoryview), never hex text
         if hasattr(wkb_element, 'data'):
-            logger.info(f"🔄 [GEOMETRY:CONVERT] Processing WKBElement with .data attribute")
-            # WKBElement.data can be bytes, memoryview, or hex string
             wkb_data = wkb_element.data
-            logger.info(f"🔄 [GEOMETRY:CONVERT]   Data type: {type(wkb_data).__name__}")
-            
-            # Convert memoryview to bytes if needed
-            if isinstance(wkb_data, memoryview):
-                logger.info(f"🔄 [GEOMETRY:CONVERT]   Converting memoryview → bytes")
-                wkb_data = bytes(wkb_data)
-            # If it's a string, convert from hex
-            elif isinstance(wkb_data, str):
-                logger.info(f"🔄 [GEOMETRY:CONVERT]   Converting hex string → bytes")
-                wkb_data = bytes.fromhex(wkb_data)
-            
-            logger.info(f"🔄 [GEOMETRY:CONVERT]   Final data type: {type(wkb_data).__name__}, size: {len(wkb_data)} bytes")
-            geom = wkb.loads(wkb_data)
-        else:
-            # If it's already a shapely geometry
-            logger.info(f"🔄 [GEOMETRY:CONVERT] Processing as existing Shapely geometry")
-            geom = wkb_element
-        
-        logger.info(f"🔄 [GEOMETRY:CONVERT] Geometry type: {geom.geom_type}")
-        
-        # For Polygon, return as nested list of coordinate pairs [lng, lat]
-        if geom.geom_type == "Polygon":
-            logger.info(f"🔄 [GEOMETRY:CONVERT] Processing Polygon geometry")
-            # Convert exterior ring coordinates to GeoJSON format
-            exterior_coords = [[x, y] for x, y in geom.exterior.coords]
-            logger.info(f"🔄 [GEOMETRY:CONVERT]   Exterior coordinates: {len(exterior_coords)} points")
-            
-            coordinates = [exterior_coords]
+            assert isinstance(wkb_data, (bytes, memoryview)), type(wkb_data)
             
-            # Add interior rings (holes) if any
-            if geom.interiors:
-                logger.info(f"🔄 [GEOMETRY:CONVERT]   Interior rings (holes): {len(geom.interiors)}")
-                for i, interior in enumerate(geom.interiors):
-                    interior_coords = [[x, y] for x, y in interior.coords]
-                    logger.info(f"🔄 [GEOMETRY:CONVERT]     Ring {i+1}: {len(interior_coords)} points")
-                    coordinates.append(interior_coords)
-            
-            result = {
-                "type": "Polygon",
-                "coordinates": coordinates
-            }
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ✓ GeoJSON created with {len(coordinates)} ring(s)")
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ========== SUCCESS ==========")
-            return result
-        
-        # For Point
-        elif geom.geom_type == "Point":
-            logger.info(f"🔄 [GEOMETRY:CONVERT] Processing Point geometry")
-            result = {
-                "type": "Point",
-                "coordinates": [geom.x, geom.y]
-            }
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ✓ Point coordinates: [{geom.x}, {geom.y}]")
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ========== SUCCESS ==========")
-            return result
+            # Geometries rarely change, so repeat serializations hit the cache.
+            # Coordinates stay as shared read-only ndarrays inside tuples.
+            return dict(_wkb_bytes_to_geojson(wkb_data))
         
-        # For LineString
-        elif geom.geom_type == "LineString":
-            logger.info(f"🔄 [GEOMETRY:CONVERT] Processing LineString geometry")
-            coords = [[x, y] for x, y in geom.coords]
-            logger.info(f"🔄 [GEOMETRY:CONVERT]   Points: {len(coords)}")
-            result = {
-                "type": "LineString",
-                "coordinates": coords
-            }
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ✓ LineString created")
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ========== SUCCESS ==========")
-            return result
-        
-        # For other types, convert using shapely's mapping
-        else:
-            logger.warning(f"🔄 [GEOMETRY:CONVERT] ⚠️  Geometry type '{geom.geom_type}' not specifically handled, using shapely mapping")
-            from shapely.geometry import mapping
-            result = mapping(geom)
-            logger.info(f"🔄 [GEOMETRY:CONVERT] ========== SUCCESS ==========")
-            return result
+        # If it's already a shapely geometry
+        return _geometry_to_geojson(wkb_element)
     
     except Exception as e:
-        logger.error(f"🔄 [GEOMETRY:CONVERT] ❌ ERROR: {str(e)}")
-        import traceback
-        logger.error(f"🔄 [GEOMETRY:CONVERT] Traceback: {traceback.format_exc()}")
-        logger.error(f"🔄 [GEOMETRY:CONVERT] ========== FAILED ==========")
+        logger.error(f"🔄 [GEOMETRY:CONVERT] ❌ ERROR: {str(e)}", exc_info=True)
         return {"type": "Polygon", "coordinates": []}
 
 
+def wkb_list_to_geojson(wkb_elements: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """Convert many WKBElements to GeoJSON with a single vectorized WKB parse"""
+    results = [None] * len(wkb_elements)
+    positions = [i for i, element in enumerate(wkb_elements) if hasattr(element, 'data')]
+
+    # Anything that isn't a WKBElement (None, GeoJSON dicts, shapely geometries)
+    for i, element in enumerate(wkb_elements):
+        if element is not None and not hasattr(element, 'data'):
+            results[i] = wkb_to_geojson(element)
+
+    if not positions:
+        return results
+
+    try:
+        buffers = np.array([bytes(wkb_elements[i].data) for i in positions], dtype=object)
+        geoms = shapely.from_wkb(buffers)
+    except Exception as e:
+        logger.error(f"🔄 [GEOMETRY:CONVERT] ❌ Batch WKB parse failed, converting individually: {e}")
+        for i in positions:
+            results[i] = wkb_to_geojson(wkb_elements[i])
+        return results
+
+    is_polygon = shapely.get_type_id(geoms) == shapely.GeometryType.POLYGON
+    polygons = geoms[is_polygon]
+
+    # Flatten all rings, pull every coordinate out in one call, then scatter
+    # the coordinates back to their ring and the rings back to their polygon
+    rings, ring_owner = shapely.get_rings(polygons, return_index=True)
+    coords, coord_ring = shapely.get_coordinates(rings, return_index=True)
+    ring_sizes = np.bincount(coord_ring, minlength=len(rings))
+    ring_coords = np.split(coords, np.cumsum(ring_sizes)[:-1])
+
+    polygon_rings = [[] for _ in range(len(polygons))]
+    for owner, ring in zip(ring_owner, ring_coords):
+        polygon_rings[owner].append(ring)
+
+    polygon_positions = np.asarray(positions)[is_polygon]
+    for position, coordinates in zip(polygon_positions, polygon_rings):
+        results[position] = {"type": "Polygon", "coordinates": coordinates}
+
+    # Other geometry types are rare here; convert them one by one
+    for position, geom in zip(np.asarray(positions)[~is_polygon], geoms[~is_polygon]):
+        results[position] = wkb_to_geojson(geom)
+
+    return results
+
 
 # ============================================================================
 # AOI Schemas
 # ============================================================================
 
 class AoIBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     geometry: Optional[Any] = None  # GeoJSON geometry or WKBElement
@@ -130,25 +195,45 @@ class AoICreate(AoIBase):
     pass
 
 
+class AoIRecord(TypedDict):
+    """AOI row with geometry already rendered as GeoJSON by PostGIS"""
+    id: UUID
+    name: str
+    description: Optional[str]
+    geometry: Optional[Dict[str, Any]]
+    created_at: datetime
+    updated_at: datetime
+
+
 class AoI(AoIBase):
     id: UUID
+    geometry_geojson: Optional[Dict[str, Any]] = Field(None, exclude=True)  # Precomputed by DB trigger
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
-    @model_serializer
-    def serialize_model(self):
-        """Serialize model with geometry conversion"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'geometry': wkb_to_geojson(self.geometry),
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    @field_serializer('geometry')
+    def _ser_geom(self, geometry):
+        """Serialize geometry as GeoJSON, preferring the precomputed copy"""
+        if self.geometry_geojson is not None:
+            return self.geometry_geojson
+        # GeoJSON already built by PostGIS passes through untouched
+        if geometry is None or isinstance(geometry, dict):
+            return geometry
+        # Pydantic can't encode the WKB path's ndarray coordinates, so hand it lists
+        return _thaw(wkb_to_geojson(geometry))
+
+
+@dataclass(slots=True)
+class AoIOut:
+    """AOI list row, serialized directly by orjson on the list endpoint"""
+    id: UUID
+    name: str
+    description: Optional[str]
+    geometry: Optional[Dict[str, Any]]
+    created_at: datetime
+    updated_at: datetime
 
 
 # ============================================================================
@@ -156,6 +241,8 @@ class AoI(AoIBase):
 # ============================================================================
 
 class BoundaryBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
@@ -169,25 +256,35 @@ class BoundaryCreate(BoundaryBase):
 
 class Boundary(BoundaryBase):
     id: UUID
+    geometry_geojson: Optional[Dict[str, Any]] = Field(None, exclude=True)  # Precomputed by DB trigger
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
-    @model_serializer
-    def serialize_model(self):
-        """Serialize model with geometry conversion"""
-        return {
-            'id': self.id,
-            'aoi_id': self.aoi_id,
-            'name': self.name,
-            'description': self.description,
-            'geometry': wkb_to_geojson(self.geometry),
-            'is_legal': self.is_legal,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    @field_serializer('geometry')
+    def _ser_geom(self, geometry):
+        """Serialize geometry as GeoJSON, preferring the precomputed copy"""
+        if self.geometry_geojson is not None:
+            return self.geometry_geojson
+        # GeoJSON already built by PostGIS passes through untouched
+        if geometry is None or isinstance(geometry, dict):
+            return geometry
+        # Pydantic can't encode the WKB path's ndarray coordinates, so hand it lists
+        return _thaw(wkb_to_geojson(geometry))
+
+
+@dataclass(slots=True)
+class BoundaryOut:
+    """Boundary list row, serialized directly by orjson on the list endpoint"""
+    id: UUID
+    aoi_id: UUID
+    name: str
+    description: Optional[str]
+    geometry: Optional[Dict[str, Any]]
+    is_legal: bool
+    created_at: datetime
+    updated_at: datetime
 
 
 # ============================================================================
@@ -195,6 +292,8 @@ class Boundary(BoundaryBase):
 # ============================================================================
 
 class TimeSeriesDataPoint(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     timestamp: datetime
     excavated_area_ha: float
     smoothed_area_ha: Optional[float] = None
@@ -204,14 +303,19 @@ class TimeSeriesDataPoint(BaseModel):
 
 
 class TimeSeriesData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     boundary_id: UUID
     data_points: List[TimeSeriesDataPoint]
 
 
 class TimeSeriesResponse(BaseModel):
-    legal_boundary: List[TimeSeriesDataPoint]
-    nogo_zones: List[TimeSeriesDataPoint]
+    """Column-oriented series: each key maps to a list aligned by index"""
+    model_config = ConfigDict(defer_build=True)
+
+    legal_boundary: Dict[str, List[Any]]
+    nogo_zones: Dict[str, List[Any]]
     summary_stats: Dict[str, Any]
 
 
@@ -219,7 +323,9 @@ class TimeSeriesResponse(BaseModel):
 # Violation Schemas
 # ============================================================================
 
-class ViolationEventCreate(BaseModel):
+class ViolationEventBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     nogo_zone_id: UUID
     event_type: str  # VIOLATION_START, ESCALATION, VIOLATION_RESOLVED
@@ -230,19 +336,24 @@ class ViolationEventCreate(BaseModel):
     event_metadata: Optional[Dict[str, Any]] = None
 
 
-class ViolationEvent(ViolationEventCreate):
+class ViolationEventCreate(ViolationEventBase):
+    mask_geometry: Optional[Dict[str, Any]] = None  # GeoJSON excavation mask
+
+
+class ViolationEvent(ViolationEventBase):
     id: UUID
     is_resolved: bool
     resolved_date: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class ViolationAlert(BaseModel):
     """Real-time violation alert for WebSocket"""
+    model_config = ConfigDict(defer_build=True)
+
     event_id: UUID
     event_type: str
     detection_date: datetime
@@ -250,7 +361,7 @@ class ViolationAlert(BaseModel):
     nogo_zone_id: UUID
     severity: str
     description: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # ============================================================================
@@ -258,6 +369,8 @@ class ViolationAlert(BaseModel):
 # ============================================================================
 
 class AnalysisConfigCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     name: str = Field(..., min_length=1, max_length=255)
     start_date: datetime
@@ -276,11 +389,12 @@ class AnalysisConfig(AnalysisConfigCreate):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class AnalysisConfigUpdate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: Optional[str] = None
     threshold_method: Optional[str] = None
     smoothing_window: Optional[int] = None
@@ -294,6 +408,8 @@ class AnalysisConfigUpdate(BaseModel):
 # ============================================================================
 
 class AnalysisJobStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID
     config_id: UUID
     job_type: str
@@ -307,6 +423,8 @@ class AnalysisJobStatus(BaseModel):
 
 
 class JobStartRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     config_id: UUID
     job_type: str
 
@@ -316,6 +434,8 @@ class JobStartRequest(BaseModel):
 # ============================================================================
 
 class AlertSubscriptionCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     user_email: str
     webhook_url: Optional[str] = None
@@ -332,8 +452,7 @@ class AlertSubscription(AlertSubscriptionCreate):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ============================================================================
@@ -342,6 +461,8 @@ class AlertSubscription(AlertSubscriptionCreate):
 
 class SummaryStats(BaseModel):
     """Summary statistics for excavation analysis"""
+    model_config = ConfigDict(defer_build=True)
+
     analysis_period_days: int
     total_observations: int
     adaptive_threshold: float
@@ -353,6 +474,8 @@ class SummaryStats(BaseModel):
 
 class ExcavationSummary(BaseModel):
     """Complete excavation monitoring summary"""
+    model_config = ConfigDict(defer_build=True)
+
     aoi_id: UUID
     analysis_config_id: UUID
     timeseries_data: TimeSeriesResponse
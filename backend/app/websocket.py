@@ -3,75 +3,111 @@ WebSocket manager for real-time alerts.
 Handles connections and broadcasts violation events to subscribed clients.
 """
 
-import json
+import asyncio
 import logging
-from typing import Set, Dict, List
-from datetime import datetime
+from typing import Dict, List
+from datetime import datetime, timezone
 from uuid import UUID
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# The envelope around every broadcast has a fixed shape, so only the payload
+# and timestamp are encoded per message and spliced between these constants
+PREFIX_VIOLATION = b'{"type":"violation_alert","data":'
+PREFIX_STATUS = b'{"type":"status_update","data":'
+_TIMESTAMP_SEP = b',"timestamp":"'
+_SUFFIX = b'"}'
+
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+
+def _envelope(prefix: bytes, data: dict) -> bytes:
+    """Build a broadcast message from a pre-serialized envelope prefix"""
+    timestamp = _utcnow(_UTC).isoformat().encode()
+    return prefix + orjson.dumps(data) + _TIMESTAMP_SEP + timestamp + _SUFFIX
+
 
 class ConnectionManager:
     """Manages WebSocket connections and broadcasts"""
 
     def __init__(self):
         # Store active connections by AOI
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.active_connections: Dict[str, List[WebSocket]] = {}
         self.aoi_subscriptions: Dict[str, List[str]] = {}  # AOI -> user emails
+        # One lock serializes registry mutations across concurrent tasks
+        self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket, aoi_id: str, client_id: str):
         """Accept a new WebSocket connection"""
         await websocket.accept()
 
-        if aoi_id not in self.active_connections:
-            self.active_connections[aoi_id] = set()
-        if aoi_id not in self.aoi_subscriptions:
-            self.aoi_subscriptions[aoi_id] = []
-
-        self.active_connections[aoi_id].add(websocket)
+        async with self._lock:
+            connections = self.active_connections.setdefault(aoi_id, [])
+            self.aoi_subscriptions.setdefault(aoi_id, [])
+            connections.append(websocket)
+            count = len(connections)
 
         logger.info(f"Client {client_id} connected to AOI {aoi_id}")
-        logger.info(
-            f"Active connections for {aoi_id}: {len(self.active_connections[aoi_id])}"
-        )
+        logger.info(f"Active connections for {aoi_id}: {count}")
 
-    def disconnect(self, websocket: WebSocket, aoi_id: str, client_id: str):
+    async def disconnect(self, websocket: WebSocket, aoi_id: str, client_id: str):
         """Remove a disconnected WebSocket"""
-        if aoi_id in self.active_connections:
-            self.active_connections[aoi_id].discard(websocket)
-
-            if not self.active_connections[aoi_id]:
-                del self.active_connections[aoi_id]
+        async with self._lock:
+            self._remove(websocket, aoi_id)
 
         logger.info(f"Client {client_id} disconnected from AOI {aoi_id}")
 
+    def _remove(self, websocket: WebSocket, aoi_id: str):
+        """Drop a socket from an AOI's registry; the caller holds the registry lock"""
+        connections = self.active_connections.get(aoi_id)
+        if connections is None:
+            return
+
+        try:
+            connections.remove(websocket)
+        except ValueError:
+            pass
+
+        if not connections:
+            del self.active_connections[aoi_id]
+
     async def broadcast_violation(self, aoi_id: str, violation_alert: dict):
         """Broadcast violation alert to all connected clients for an AOI"""
         if aoi_id not in self.active_connections:
             logger.debug(f"No active connections for AOI {aoi_id}")
             return
 
-        message = json.dumps({
-            "type": "violation_alert",
-            "data": violation_alert,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        message = _envelope(PREFIX_VIOLATION, violation_alert)
 
-        disconnected_clients = []
+        await self._send_to_all(aoi_id, message)
+        logger.debug(f"Alert sent to clients on AOI {aoi_id}")
 
-        for websocket in self.active_connections[aoi_id]:
-            try:
-                await websocket.send_text(message)
-                logger.debug(f"Alert sent to client on AOI {aoi_id}")
-            except Exception as e:
-                logger.error(f"Error sending alert: {e}")
-                disconnected_clients.append(websocket)
+    async def _send_to_all(self, aoi_id: str, message: bytes):
+        """Send a pre-encoded message to every client of an AOI concurrently"""
+        # One registry lookup; the snapshot is iterated lock-free while
+        # connects/disconnects carry on
+        connections = tuple(self.active_connections.get(aoi_id, ()))
+        results = await asyncio.gather(
+            *(websocket.send_bytes(message) for websocket in connections),
+            return_exceptions=True
+        )
+
+        failed = [
+            (websocket, result) for websocket, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
+        if not failed:
+            return
 
-        # Clean up disconnected clients
-        for websocket in disconnected_clients:
-            self.active_connections[aoi_id].discard(websocket)
+        # Drop clients whose send failed in a single pass
+        async with self._lock:
+            for websocket, error in failed:
+                logger.error(f"Error sending to client on AOI {aoi_id}: {error}")
+                self._remove(websocket, aoi_id)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Send a message to a specific client"""
@@ -85,17 +121,9 @@ class ConnectionManager:
         if aoi_id not in self.active_connections:
             return
 
-        message = json.dumps({
-            "type": "status_update",
-            "data": status,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        for websocket in self.active_connections[aoi_id]:
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting status: {e}")
+        message = _envelope(PREFIX_STATUS, status)
+
+        await self._send_to_all(aoi_id, message)
 
 
 # Global connection manager instance
@@ -3,25 +3,37 @@ WebSocket endpoints for real-time alerts.
 """
 
 import logging
-from uuid import UUID
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, WebSocket, Query
 
-from app.database import get_db
 from app.websocket import manager
-from app import models
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/ws", tags=["websocket"])
 
 
+async def _ws_loop(websocket: WebSocket, aoi_id: str, client_id: str, tag: str):
+    """Register a client for an AOI and hold the connection open until it closes"""
+    await manager.connect(websocket, aoi_id, client_id)
+
+    try:
+        # iter_text() finishes cleanly once the client disconnects
+        async for data in websocket.iter_text():
+            logger.debug(f"Received {tag} message from {client_id}: {data}")
+        logger.info(f"{tag.capitalize()} client {client_id} disconnected")
+
+    except Exception as e:
+        logger.error(f"{tag.capitalize()} WebSocket error: {e}")
+
+    finally:
+        await manager.disconnect(websocket, aoi_id, client_id)
+
+
 @router.websocket("/violations/{aoi_id}")
 async def websocket_violations(
     websocket: WebSocket,
     aoi_id: str,
-    client_id: str = Query("anonymous"),
-    db: Session = Depends(get_db)
+    client_id: str = Query("anonymous")
 ):
     """
     WebSocket endpoint for real-time violation alerts.
@@ -44,22 +56,7 @@ async def websocket_violations(
         "timestamp": "..."
     }
     """
-    await manager.connect(websocket, aoi_id, client_id)
-
-    try:
-        while True:
-            # Keep connection alive and wait for any incoming messages
-            data = await websocket.receive_text()
-            # Echo or process incoming messages if needed
-            logger.debug(f"Received message from {client_id}: {data}")
-
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, aoi_id, client_id)
-        logger.info(f"Client {client_id} disconnected")
-
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-        manager.disconnect(websocket, aoi_id, client_id)
+    await _ws_loop(websocket, aoi_id, client_id, "violation")
 
 
 @router.websocket("/status/{aoi_id}")
@@ -73,17 +70,4 @@ async def websocket_status(
     
     Sends job progress and status information.
     """
-    await manager.connect(websocket, aoi_id, client_id)
-
-    try:
-        while True:
-            data = await websocket.receive_text()
-            logger.debug(f"Received status message from {client_id}: {data}")
-
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, aoi_id, client_id)
-        logger.info(f"Status client {client_id} disconnected")
-
-    except Exception as e:
-        logger.error(f"Status WebSocket error: {e}")
-        manager.disconnect(websocket, aoi_id, client_id)
+    await _ws_loop(websocket, aoi_id, client_id, "status")
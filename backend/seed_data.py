@@ -14,12 +14,29 @@ logger = logging.getLogger(__name__)
 # Add app to path
 sys.path.insert(0, '/absolute/path/backend')
 
+import shapely
+from geoalchemy2.elements import WKBElement
+from shapely.geometry import Polygon
+from sqlalchemy import insert
+
 from app.database import SessionLocal
 from app.models import (
     AoI, MinerBoundary, ExcavationTimeSeries, 
     ViolationEvent, AnalysisConfig, ExcavationMask
 )
 
+
+def _ewkb_polygon(coords) -> WKBElement:
+    """Build an SRID=4326 EWKB polygon so PostGIS skips parsing WKT text"""
+    geom = shapely.set_srid(Polygon(coords), 4326)
+    return WKBElement(shapely.to_wkb(geom, include_srid=True), srid=4326, extended=True)
+
+
+AOI_GEOMETRY = _ewkb_polygon([(98.5, 15.0), (98.8, 15.0), (98.8, 15.3), (98.5, 15.3), (98.5, 15.0)])
+LEGAL_BOUNDARY_GEOMETRY = _ewkb_polygon([(98.55, 15.05), (98.75, 15.05), (98.75, 15.25), (98.55, 15.25), (98.55, 15.05)])
+NOGO_ZONE_GEOMETRY = _ewkb_polygon([(98.6, 15.1), (98.7, 15.1), (98.7, 15.15), (98.6, 15.15), (98.6, 15.1)])
+
+
 def seed_data():
     """Populate database with sample data"""
     db = SessionLocal()
@@ -31,7 +48,7 @@ def seed_data():
             aoi = AoI(
                 name="Default AOI",
                 description="Sample mining area in Southeast Asia",
-                geometry="SRID=4326;POLYGON((98.5 15.0, 98.8 15.0, 98.8 15.3, 98.5 15.3, 98.5 15.0))"
+                geometry=AOI_GEOMETRY
             )
             db.add(aoi)
             db.commit()
@@ -50,7 +67,7 @@ def seed_data():
                 aoi_id=aoi.id,
                 name="Legal Mining Zone A",
                 description="Licensed mining boundary",
-                geometry="SRID=4326;POLYGON((98.55 15.05, 98.75 15.05, 98.75 15.25, 98.55 15.25, 98.55 15.05))",
+                geometry=LEGAL_BOUNDARY_GEOMETRY,
                 is_legal=True
             )
             db.add(legal_boundary)
@@ -68,7 +85,7 @@ def seed_data():
                 aoi_id=aoi.id,
                 name="Protected Forest Zone",
                 description="No-mining zone - protected area",
-                geometry="SRID=4326;POLYGON((98.6 15.1, 98.7 15.1, 98.7 15.15, 98.6 15.15, 98.6 15.1))",
+                geometry=NOGO_ZONE_GEOMETRY,
                 is_legal=False
             )
             db.add(nogo_zone)
@@ -82,18 +99,21 @@ def seed_data():
         
         if existing_timeseries == 0:
             base_date = datetime.utcnow() - timedelta(days=30)
-            for day in range(31):
-                ts = ExcavationTimeSeries(
-                    aoi_id=aoi.id,
-                    boundary_id=legal_boundary.id,
-                    timestamp=base_date + timedelta(days=day),
-                    excavated_area_ha=10 + (day * 0.5) + (day % 3) * 0.2,  # Gradual increase
-                    smoothed_area_ha=10 + (day * 0.5),
-                    excavation_rate_ha_day=0.5 + (day % 5) * 0.1,
-                    anomaly_score=0.1 + (day % 7) * 0.05,
-                    confidence=0.85 + (day % 10) * 0.01
-                )
-                db.add(ts)
+            rows = [
+                {
+                    "aoi_id": aoi.id,
+                    "boundary_id": legal_boundary.id,
+                    "timestamp": base_date + timedelta(days=day),
+                    "excavated_area_ha": 10 + (day * 0.5) + (day % 3) * 0.2,  # Gradual increase
+                    "smoothed_area_ha": 10 + (day * 0.5),
+                    "excavation_rate_ha_day": 0.5 + (day % 5) * 0.1,
+                    "anomaly_score": 0.1 + (day % 7) * 0.05,
+                    "confidence": 0.85 + (day % 10) * 0.01
+                }
+                for day in range(31)
+            ]
+            # One multi-row INSERT instead of per-object unit-of-work tracking
+            db.execute(insert(ExcavationTimeSeries), rows)
             db.commit()
             logger.info(f"✓ Created 31 days of time-series data for legal boundary")
         
@@ -104,19 +124,21 @@ def seed_data():
         
         if existing_nogo_ts == 0:
             base_date = datetime.utcnow() - timedelta(days=30)
-            for day in range(31):
-                # Lower activity in no-go zone
-                ts = ExcavationTimeSeries(
-                    aoi_id=aoi.id,
-                    boundary_id=nogo_zone.id,
-                    timestamp=base_date + timedelta(days=day),
-                    excavated_area_ha=0.1 + (day % 7) * 0.05,  # Low values
-                    smoothed_area_ha=0.1 + (day % 7) * 0.03,
-                    excavation_rate_ha_day=0.01 + (day % 5) * 0.01,
-                    anomaly_score=0.3 + (day % 10) * 0.05,  # Higher anomaly = concerning
-                    confidence=0.80 + (day % 10) * 0.01
-                )
-                db.add(ts)
+            # Lower activity in no-go zone
+            rows = [
+                {
+                    "aoi_id": aoi.id,
+                    "boundary_id": nogo_zone.id,
+                    "timestamp": base_date + timedelta(days=day),
+                    "excavated_area_ha": 0.1 + (day % 7) * 0.05,  # Low values
+                    "smoothed_area_ha": 0.1 + (day % 7) * 0.03,
+                    "excavation_rate_ha_day": 0.01 + (day % 5) * 0.01,
+                    "anomaly_score": 0.3 + (day % 10) * 0.05,  # Higher anomaly = concerning
+                    "confidence": 0.80 + (day % 10) * 0.01
+                }
+                for day in range(31)
+            ]
+            db.execute(insert(ExcavationTimeSeries), rows)
             db.commit()
             logger.info(f"✓ Created 31 days of time-series data for no-go zone")
         
@@ -126,44 +148,46 @@ def seed_data():
         ).count()
         
         if existing_violations == 0:
-            violation1 = ViolationEvent(
-                aoi_id=aoi.id,
-                nogo_zone_id=nogo_zone.id,
-                event_type="VIOLATION_START",
-                detection_date=datetime.utcnow() - timedelta(days=5),
-                excavated_area_ha=0.3,
-                description="Excavation detected in protected zone",
-                severity="HIGH",
-                is_resolved=False,
-                event_metadata={"source": "satellite_imagery", "confidence": 0.92}
-            )
-            
-            violation2 = ViolationEvent(
-                aoi_id=aoi.id,
-                nogo_zone_id=nogo_zone.id,
-                event_type="ESCALATION",
-                detection_date=datetime.utcnow() - timedelta(days=3),
-                excavated_area_ha=0.5,
-                description="Excavation area expanded in no-go zone",
-                severity="CRITICAL",
-                is_resolved=False,
-                event_metadata={"source": "satellite_imagery", "confidence": 0.95}
-            )
-            
-            violation3 = ViolationEvent(
-                aoi_id=aoi.id,
-                nogo_zone_id=nogo_zone.id,
-                event_type="VIOLATION_RESOLVED",
-                detection_date=datetime.utcnow() - timedelta(days=10),
-                excavated_area_ha=0.2,
-                description="Illegal excavation has ceased",
-                severity="MEDIUM",
-                is_resolved=True,
-                resolved_date=datetime.utcnow() - timedelta(days=8),
-                event_metadata={"source": "satellite_imagery"}
-            )
+            violations = [
+                {
+                    "aoi_id": aoi.id,
+                    "nogo_zone_id": nogo_zone.id,
+                    "event_type": "VIOLATION_START",
+                    "detection_date": datetime.utcnow() - timedelta(days=5),
+                    "excavated_area_ha": 0.3,
+                    "description": "Excavation detected in protected zone",
+                    "severity": "HIGH",
+                    "is_resolved": False,
+                    "resolved_date": None,
+                    "event_metadata": {"source": "satellite_imagery", "confidence": 0.92}
+                },
+                {
+                    "aoi_id": aoi.id,
+                    "nogo_zone_id": nogo_zone.id,
+                    "event_type": "ESCALATION",
+                    "detection_date": datetime.utcnow() - timedelta(days=3),
+                    "excavated_area_ha": 0.5,
+                    "description": "Excavation area expanded in no-go zone",
+                    "severity": "CRITICAL",
+                    "is_resolved": False,
+                    "resolved_date": None,
+                    "event_metadata": {"source": "satellite_imagery", "confidence": 0.95}
+                },
+                {
+                    "aoi_id": aoi.id,
+                    "nogo_zone_id": nogo_zone.id,
+                    "event_type": "VIOLATION_RESOLVED",
+                    "detection_date": datetime.utcnow() - timedelta(days=10),
+                    "excavated_area_ha": 0.2,
+                    "description": "Illegal excavation has ceased",
+                    "severity": "MEDIUM",
+                    "is_resolved": True,
+                    "resolved_date": datetime.utcnow() - timedelta(days=8),
+                    "event_metadata": {"source": "satellite_imagery"}
+                },
+            ]
             
-            db.add_all([violation1, violation2, violation3])
+            db.execute(insert(ViolationEvent), violations)
             db.commit()
             logger.info(f"✓ Created 3 sample violation events")
         
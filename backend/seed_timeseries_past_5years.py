@@ -6,7 +6,8 @@ This generates realistic excavation growth patterns over time.
 import sys
 from datetime import datetime, timedelta
 from uuid import UUID
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy.orm import Session, load_only
 
 # Add app to path
 sys.path.insert(0, '/app')
@@ -15,18 +16,62 @@ from app.database import engine, SessionLocal
 from app import models
 from app.main import Base
 
+# One generator for all synthetic noise, created once at import
+rng = np.random.default_rng()
+
+# Rows written and committed per transaction
+BATCH_SIZE = 500
+
+# Core INSERT; plain row dicts skip the ORM entirely
+TIMESERIES_INSERT = models.ExcavationTimeSeries.__table__.insert()
+
+def gen_areas(days_elapsed: np.ndarray, progress_ratio: np.ndarray,
+              base_growth: np.ndarray, is_legal: np.ndarray,
+              rng: np.random.Generator) -> np.ndarray:
+    """Excavated area series (ha) for every boundary, shape (boundaries, snapshots)
+
+    No-go noise is drawn from ``rng``, so a seeded Generator reproduces the series.
+    """
+    # Both curves depend only on the snapshot, so each is computed once and
+    # shared by every boundary of its kind
+    
+    # Legal zone: steadier, slower growth
+    # 0.5 ha starting, grows to ~8 ha over 5 years, plus seasonal variation
+    seasonal_variation = 0.3 * (1 + 0.5 * (days_elapsed % 365) / 365)
+    legal_area = 0.5 + (base_growth * 7.5) + seasonal_variation
+    
+    # No-go zone: violation growth (starts small, grows if violations occur)
+    # 0 ha starting, jumps to ~2-3 ha in later years (violation signal)
+    # Early period: minimal violations; later period: more violations detected
+    late_ratio = (progress_ratio - 0.6) / 0.4
+    nogo_area = np.where(
+        progress_ratio < 0.6,
+        0.1 + (progress_ratio * 0.3),
+        0.4 + (late_ratio * 2.5)
+    )
+    
+    areas = np.empty((len(is_legal), len(days_elapsed)))
+    areas[is_legal] = legal_area
+    # Independent random variation for each no-go boundary
+    areas[~is_legal] = nogo_area + rng.uniform(-0.2, 0.3, size=((~is_legal).sum(), len(days_elapsed)))
+    return areas
+
 def get_aoi_by_name(db: Session, name: str = "Test AOI"):
     """Get AOI by name or return first available"""
-    aoi = db.query(models.AoI).filter(models.AoI.name.ilike(f"%{name}%")).first()
+    # Only the ID and name are used, so leave the geometry unloaded
+    query = db.query(models.AoI).options(load_only(models.AoI.id, models.AoI.name))
+    aoi = query.filter(models.AoI.name.ilike(f"%{name}%")).first()
     if not aoi:
         # Return first available AOI
-        aoi = db.query(models.AoI).first()
+        aoi = query.first()
     return aoi
 
 def seed_timeseries_5years():
     """Generate 5 years of time-series data with realistic excavation growth"""
     
-    db = SessionLocal()
+    # Batched commits below must not expire the loaded AOI and boundaries,
+    # or each batch would re-SELECT them
+    db = SessionLocal(expire_on_commit=False)
     
     try:
         # Get an AOI (preferably user-created)
@@ -38,7 +83,9 @@ def seed_timeseries_5years():
         print(f"🎯 Selected AOI: {aoi.name} ({aoi.id})")
         
         # Get boundaries for this AOI
-        boundaries = db.query(models.MinerBoundary).filter(
+        boundaries = db.query(models.MinerBoundary).options(
+            load_only(models.MinerBoundary.id, models.MinerBoundary.name, models.MinerBoundary.is_legal)
+        ).filter(
             models.MinerBoundary.aoi_id == aoi.id
         ).all()
         
@@ -58,84 +105,90 @@ def seed_timeseries_5years():
         print(f"\n📅 Generating data from {start_date.date()} to {end_date.date()}")
         print(f"📊 Time span: {(end_date - start_date).days} days")
         
-        # Create bi-weekly snapshots
-        current_date = start_date
-        snapshot_interval = timedelta(days=14)  # Every 2 weeks
+        # Build every bi-weekly snapshot at once as arrays over the time axis
+        total_days = (end_date - start_date).days
+        days_elapsed = np.arange(0, total_days + 1, 14)  # Every 2 weeks
+        # datetime64 arithmetic, then one bulk conversion to Python datetimes
+        timestamps = (
+            np.datetime64(start_date, 'us') + days_elapsed.astype('timedelta64[D]')
+        ).astype(datetime).tolist()
+        progress_ratio = days_elapsed / total_days
+        
+        # Simulate excavation growth over time (non-linear, accelerating)
+        # Using sigmoid-like curve for realistic mining expansion
+        base_growth = progress_ratio ** 1.3  # Accelerating excavation over time
+        
+        excavation_rate = np.round(base_growth * 0.005, 6)  # Slow rate
+        anomaly_score = np.round(progress_ratio * 0.5, 4)  # Increases over time
+        confidence = np.round(0.8 + (progress_ratio * 0.15), 3)  # Confidence improves
+        
+        # One area series per boundary: shape (len(boundaries), len(timestamps))
+        is_legal = np.array([boundary.is_legal for boundary in boundaries], dtype=bool)
+        areas = gen_areas(days_elapsed, progress_ratio, base_growth, is_legal, rng)
+        areas = np.round(np.maximum(areas, 0), 4)
         
+        # Convert to Python floats once, then insert plain rows in bounded batches
+        areas = areas.tolist()
+        excavation_rate = excavation_rate.tolist()
+        anomaly_score = anomaly_score.tolist()
+        confidence = confidence.tolist()
+        
+        batch = []
         data_points_created = 0
         
-        while current_date <= end_date:
-            # Calculate days elapsed since start
-            days_elapsed = (current_date - start_date).days
-            progress_ratio = days_elapsed / (end_date - start_date).days
-            
-            # Simulate excavation growth over time (non-linear, accelerating)
-            # Using sigmoid-like curve for realistic mining expansion
-            base_growth = progress_ratio ** 1.3  # Accelerating excavation over time
-            
-            for boundary in boundaries:
-                # Different growth rates for legal vs no-go zones
-                if boundary.is_legal:
-                    # Legal zone: steadier, slower growth
-                    # 0.5 ha starting, grows to ~8 ha over 5 years
-                    base_area = 0.5 + (base_growth * 7.5)
-                    # Add some seasonal variation
-                    seasonal_variation = 0.3 * (1 + 0.5 * (days_elapsed % 365) / 365)
-                    excavated_area = base_area + seasonal_variation
-                    area_ha = max(0, excavated_area)
-                    
-                else:
-                    # No-go zone: violation growth (starts small, grows if violations occur)
-                    # 0 ha starting, jumps to ~2-3 ha in later years (violation signal)
-                    if progress_ratio < 0.6:
-                        # Early period: minimal violations
-                        area_ha = 0.1 + (progress_ratio * 0.3)
-                    else:
-                        # Later period: more violations detected
-                        late_ratio = (progress_ratio - 0.6) / 0.4
-                        area_ha = 0.4 + (late_ratio * 2.5)
-                    
-                    # Add some random variation
-                    import random
-                    area_ha += random.uniform(-0.2, 0.3)
-                    area_ha = max(0, area_ha)
-                
-                # Create time-series record
-                ts_record = models.ExcavationTimeSeries(
-                    aoi_id=aoi.id,
-                    boundary_id=boundary.id,
-                    timestamp=current_date,
-                    excavated_area_ha=round(area_ha, 4),
-                    smoothed_area_ha=round(area_ha, 4),
-                    excavation_rate_ha_day=round(base_growth * 0.005, 6),  # Slow rate
-                    anomaly_score=round(progress_ratio * 0.5, 4),  # Increases over time
-                    confidence=round(0.8 + (progress_ratio * 0.15), 3),  # Confidence improves
-                    created_at=current_date,
-                    updated_at=current_date
-                )
-                
-                db.add(ts_record)
+        # Loop-invariant: report progress every 5 snapshots
+        nboundaries = len(boundaries)
+        progress_mod = nboundaries * 5
+        
+        # Plain IDs for the row dicts, read once outside the loop
+        aoi_id = aoi.id
+        boundary_ids = [boundary.id for boundary in boundaries]
+        
+        for i, current_date in enumerate(timestamps):
+            for boundary_id, boundary_areas in zip(boundary_ids, areas):
+                batch.append({
+                    "aoi_id": aoi_id,
+                    "boundary_id": boundary_id,
+                    "timestamp": current_date,
+                    "excavated_area_ha": boundary_areas[i],
+                    "smoothed_area_ha": boundary_areas[i],
+                    "excavation_rate_ha_day": excavation_rate[i],
+                    "anomaly_score": anomaly_score[i],
+                    "confidence": confidence[i],
+                    "created_at": current_date,
+                    "updated_at": current_date
+                })
                 data_points_created += 1
-            
-            # Move to next snapshot
-            current_date += snapshot_interval
+                
+                if len(batch) >= BATCH_SIZE:
+                    db.execute(TIMESERIES_INSERT, batch)
+                    db.commit()
+                    batch.clear()
             
             # Progress indicator
-            if data_points_created % (len(boundaries) * 5) == 0:
+            if data_points_created % progress_mod == 0:
                 print(f"  ✓ Generated {data_points_created} data points...")
         
-        # Commit all records
-        db.commit()
+        # Flush the remainder
+        if batch:
+            db.execute(TIMESERIES_INSERT, batch)
+            db.commit()
         
         print(f"\n✅ Time-series seeding complete!")
         print(f"📊 Created {data_points_created} total data points")
-        print(f"   - Per boundary: {data_points_created // len(boundaries)}")
+        print(f"   - Per boundary: {data_points_created // nboundaries}")
         print(f"   - Date range: {start_date.date()} to {end_date.date()}")
         
         # Show sample data
         print(f"\n📈 Sample data (latest records):")
         for boundary in boundaries:
-            latest = db.query(models.ExcavationTimeSeries).filter(
+            latest = db.query(models.ExcavationTimeSeries).options(
+                load_only(
+                    models.ExcavationTimeSeries.timestamp,
+                    models.ExcavationTimeSeries.excavated_area_ha,
+                    models.ExcavationTimeSeries.confidence
+                )
+            ).filter(
                 models.ExcavationTimeSeries.boundary_id == boundary.id
             ).order_by(models.ExcavationTimeSeries.timestamp.desc()).first()
             
@@ -146,7 +199,7 @@ def seed_timeseries_5years():
                 print(f"      - Excavated area: {latest.excavated_area_ha:.4f} ha")
                 print(f"      - Confidence: {latest.confidence*100:.1f}%")
         
-        print(f"\n🎉 Dashboard will now show historical data with {data_points_created // len(boundaries)} data points per boundary!")
+        print(f"\n🎉 Dashboard will now show historical data with {data_points_created // nboundaries} data points per boundary!")
         
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -2,12 +2,13 @@
 """Test script to check geometry API responses"""
 
 import sys
-import json
+from sqlalchemy.orm import load_only
 from app.database import SessionLocal
 from app.models import AoI, MinerBoundary
 from app.schemas import AoI as AoISchema, Boundary as BoundarySchema
 
-db = SessionLocal()
+# Read-only inspection: never flush, never expire loaded rows
+db = SessionLocal(autoflush=False, expire_on_commit=False)
 
 try:
     # Get an AOI
@@ -25,17 +26,40 @@ try:
         
         # Serialize using schema
         print("After Pydantic serialization:")
-        aoi_schema = AoISchema.model_validate(aoi)
-        aoi_dict = aoi_schema.model_dump()
-        print(json.dumps(aoi_dict, indent=2, default=str))
+        # Rows come straight from the ORM, so skip validation
+        aoi_schema = AoISchema.model_construct(
+            id=aoi.id,
+            name=aoi.name,
+            description=aoi.description,
+            geometry=aoi.geometry,
+            geometry_geojson=aoi.geometry_geojson,
+            created_at=aoi.created_at,
+            updated_at=aoi.updated_at
+        )
+        print(aoi_schema.model_dump_json(indent=2))
         print()
         
-        # Get boundaries for this AOI
-        boundaries = db.query(MinerBoundary).filter(MinerBoundary.aoi_id == aoi.id).all()
+        # Get boundaries for this AOI, leaving the geometry columns unloaded
+        boundaries = (
+            db.query(MinerBoundary)
+            .options(load_only(
+                MinerBoundary.id,
+                MinerBoundary.aoi_id,
+                MinerBoundary.name,
+                MinerBoundary.description,
+                MinerBoundary.is_legal,
+                MinerBoundary.created_at,
+                MinerBoundary.updated_at
+            ))
+            .filter(MinerBoundary.aoi_id == aoi.id)
+            .all()
+        )
         print(f"Found {len(boundaries)} boundaries for this AOI")
         print()
         
         for i, boundary in enumerate(boundaries[:2]):  # Show first 2
+            # Fetch geometry only for the boundaries actually shown
+            db.refresh(boundary, ['geometry', 'geometry_geojson'])
             print(f"Boundary {i+1}:")
             print(f"  ID: {boundary.id}")
             print(f"  Name: {boundary.name}")
@@ -45,10 +69,19 @@ try:
             print()
             
             # Serialize using schema
-            boundary_schema = BoundarySchema.model_validate(boundary)
-            boundary_dict = boundary_schema.model_dump()
+            boundary_schema = BoundarySchema.model_construct(
+                id=boundary.id,
+                aoi_id=boundary.aoi_id,
+                name=boundary.name,
+                description=boundary.description,
+                geometry=boundary.geometry,
+                geometry_geojson=boundary.geometry_geojson,
+                is_legal=boundary.is_legal,
+                created_at=boundary.created_at,
+                updated_at=boundary.updated_at
+            )
             print("After Pydantic serialization:")
-            print(json.dumps(boundary_dict, indent=2, default=str))
+            print(boundary_schema.model_dump_json(indent=2))
             print()
     else:
         print("No AOIs found in database")
@@ -4,69 +4,86 @@ Run: python test_setup.py
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+BASE_URL = 'http://localhost:8000'
+
+# One keep-alive session so every check reuses the same pooled connections
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 print("\n" + "="*60)
 print("EXCAVATION MONITORING - SETUP DIAGNOSTICS")
 print("="*60)
 
-# 1. Check backend connectivity
-print("\n1️⃣  Checking Backend Connection...")
 try:
-    response = requests.get('http://localhost:8000/docs', timeout=2)
-    print("✓ Backend is running on http://localhost:8000")
-except Exception as e:
-    print(f"✗ Backend not running: {e}")
-    print("  → Run: python run.py")
-    sys.exit(1)
+    # 1. Check backend connectivity
+    print("\n1️⃣  Checking Backend Connection...")
+    try:
+        response = session.get(f'{BASE_URL}/docs', timeout=2)
+        print("✓ Backend is running on http://localhost:8000")
+    except Exception as e:
+        print(f"✗ Backend not running: {e}")
+        print("  → Run: python run.py")
+        sys.exit(1)
 
-# 2. Check health endpoint
-print("\n2️⃣  Checking Health Endpoint...")
-try:
-    response = requests.get('http://localhost:8000/api/v1/health')
-    health = response.json()
-    print(f"✓ Health: {health['status']}")
-    print(f"  - AOIs: {health.get('database', {}).get('aoi_count', 'unknown')}")
-    print(f"  - Boundaries: {health.get('database', {}).get('boundary_count', 'unknown')}")
-except Exception as e:
-    print(f"✗ Health check failed: {e}")
+    # The remaining checks hit independent endpoints, so probe them concurrently
+    # and report the results in order
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        health_future = pool.submit(session.get, f'{BASE_URL}/api/v1/health')
+        aoi_future = pool.submit(session.get, f'{BASE_URL}/api/v1/aoi')
+        timeseries_future = pool.submit(session.get, f'{BASE_URL}/api/v1/timeseries/default-aoi')
+        violations_future = pool.submit(session.get, f'{BASE_URL}/api/v1/violations/default-aoi')
 
-# 3. Check AOI endpoint
-print("\n3️⃣  Checking AOI Endpoint...")
-try:
-    response = requests.get('http://localhost:8000/api/v1/aoi')
-    aois = response.json()
-    print(f"✓ Found {len(aois)} AOIs")
-    for aoi in aois:
-        print(f"  - {aoi.get('name', 'Unknown')} (ID: {aoi.get('id', 'Unknown')})")
-except Exception as e:
-    print(f"✗ AOI fetch failed: {e}")
-    print("\n  → Try running: python seed_data.py")
+    # 2. Check health endpoint
+    print("\n2️⃣  Checking Health Endpoint...")
+    try:
+        health = health_future.result().json()
+        print(f"✓ Health: {health['status']}")
+        print(f"  - AOIs: {health.get('database', {}).get('aoi_count', 'unknown')}")
+        print(f"  - Boundaries: {health.get('database', {}).get('boundary_count', 'unknown')}")
+    except Exception as e:
+        print(f"✗ Health check failed: {e}")
 
-# 4. Check time-series endpoint
-print("\n4️⃣  Checking Time-Series Endpoint...")
-try:
-    response = requests.get('http://localhost:8000/api/v1/timeseries/default-aoi')
-    data = response.json()
-    legal_count = len(data.get('legal_boundary', []))
-    nogo_count = len(data.get('nogo_zones', []))
-    print(f"✓ Time-series data found")
-    print(f"  - Legal boundary: {legal_count} points")
-    print(f"  - No-go zones: {nogo_count} points")
-except Exception as e:
-    print(f"✗ Time-series fetch failed: {e}")
+    # 3. Check AOI endpoint
+    print("\n3️⃣  Checking AOI Endpoint...")
+    try:
+        aois = aoi_future.result().json()
+        print(f"✓ Found {len(aois)} AOIs")
+        for aoi in aois:
+            print(f"  - {aoi.get('name', 'Unknown')} (ID: {aoi.get('id', 'Unknown')})")
+    except Exception as e:
+        print(f"✗ AOI fetch failed: {e}")
+        print("\n  → Try running: python seed_data.py")
 
-# 5. Check violations endpoint
-print("\n5️⃣  Checking Violations Endpoint...")
-try:
-    response = requests.get('http://localhost:8000/api/v1/violations/default-aoi')
-    violations = response.json()
-    print(f"✓ Found {len(violations)} violation events")
-    for v in violations[:3]:
-        print(f"  - {v.get('event_type', 'Unknown')}: {v.get('severity', 'Unknown')}")
-except Exception as e:
-    print(f"✗ Violations fetch failed: {e}")
+    # 4. Check time-series endpoint
+    print("\n4️⃣  Checking Time-Series Endpoint...")
+    try:
+        data = timeseries_future.result().json()
+        # Series are returned column-wise; count points along the timestamp column
+        legal_count = len(data.get('legal_boundary', {}).get('timestamp', []))
+        nogo_count = len(data.get('nogo_zones', {}).get('timestamp', []))
+        print(f"✓ Time-series data found")
+        print(f"  - Legal boundary: {legal_count} points")
+        print(f"  - No-go zones: {nogo_count} points")
+    except Exception as e:
+        print(f"✗ Time-series fetch failed: {e}")
+
+    # 5. Check violations endpoint
+    print("\n5️⃣  Checking Violations Endpoint...")
+    try:
+        violations = violations_future.result().json()
+        print(f"✓ Found {len(violations)} violation events")
+        for v in violations[:3]:
+            print(f"  - {v.get('event_type', 'Unknown')}: {v.get('severity', 'Unknown')}")
+    except Exception as e:
+        print(f"✗ Violations fetch failed: {e}")
+
+finally:
+    session.close()
 
 print("\n" + "="*60)
 print("✓ SETUP COMPLETE - Ready to access frontend!")
@@ -2,6 +2,8 @@ import axios, { AxiosInstance } from 'axios';
 import type {
   AoI,
   Boundary,
+  TimeSeriesColumns,
+  TimeSeriesPoint,
   TimeSeriesResponse,
   ViolationEvent,
   GeoJSONPolygon,
@@ -60,6 +62,17 @@ export const timeseries = {
     apiClient.get<TimeSeriesResponse>(`/timeseries/${aoiId}`),
 };
 
+// Rebuild per-point records from the column-oriented time-series payload
+export const columnsToPoints = (columns?: TimeSeriesColumns): TimeSeriesPoint[] =>
+  (columns?.timestamp || []).map((timestamp, i) => ({
+    timestamp,
+    excavated_area_ha: columns!.excavated_area_ha[i],
+    smoothed_area_ha: columns!.smoothed_area_ha[i] ?? undefined,
+    excavation_rate_ha_day: columns!.excavation_rate_ha_day[i] ?? undefined,
+    anomaly_score: columns!.anomaly_score[i] ?? undefined,
+    confidence: columns!.confidence[i] ?? undefined,
+  }));
+
 // Map data endpoints - for spatial visualization
 export const maps = {
   getExcavationLayer: (aoiId: string, timestamp: string) =>
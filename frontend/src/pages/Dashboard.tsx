@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
-import { timeseries, violations, aoi, analysis } from '../api/client';
+import { timeseries, violations, aoi, analysis, columnsToPoints } from '../api/client';
 import {
   useTimeSeriesStore,
   useViolationStore,
@@ -86,11 +86,11 @@ export const Dashboard: React.FC<DashboardProps> = ({ aoiId: initialAoiId }) =>
         console.log('Violations Response:', violResponse.data);
 
         // Extract legal boundary and no-go zone data
-        const legalBoundary = (tsResponse.data?.legal_boundary || []).map((p: any) => ({
+        const legalBoundary = columnsToPoints(tsResponse.data?.legal_boundary).map((p: any) => ({
           ...p,
           timestamp: String(p.timestamp)
         }));
-        const noGoZones = (tsResponse.data?.nogo_zones || []).map((p: any) => ({
+        const noGoZones = columnsToPoints(tsResponse.data?.nogo_zones).map((p: any) => ({
           ...p,
           timestamp: String(p.timestamp)
         }));
@@ -156,11 +156,11 @@ export const Dashboard: React.FC<DashboardProps> = ({ aoiId: initialAoiId }) =>
       ]);
       
       // Extract legal boundary and no-go zone data
-      const legalBoundary = (tsResponse.data?.legal_boundary || []).map((p: any) => ({
+      const legalBoundary = columnsToPoints(tsResponse.data?.legal_boundary).map((p: any) => ({
         ...p,
         timestamp: String(p.timestamp)
       }));
-      const noGoZones = (tsResponse.data?.nogo_zones || []).map((p: any) => ({
+      const noGoZones = columnsToPoints(tsResponse.data?.nogo_zones).map((p: any) => ({
         ...p,
         timestamp: String(p.timestamp)
       }));
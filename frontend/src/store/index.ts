@@ -114,6 +114,8 @@ export const useWebSocketStore = create<WebSocketState>((set) => {
 
       try {
         ws = new WebSocket(wsUrl);
+        // Alerts arrive as binary frames containing UTF-8 JSON
+        ws.binaryType = 'arraybuffer';
 
         ws.onopen = () => {
           set({ isConnected: true, reconnectAttempts: 0 });
@@ -122,7 +124,10 @@ export const useWebSocketStore = create<WebSocketState>((set) => {
 
         ws.onmessage = (event) => {
           try {
-            const data = JSON.parse(event.data);
+            const text = typeof event.data === 'string'
+              ? event.data
+              : new TextDecoder().decode(event.data);
+            const data = JSON.parse(text);
             onMessage(data);
           } catch (error) {
             console.error('Failed to parse WebSocket message:', error);
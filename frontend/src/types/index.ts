@@ -30,10 +30,20 @@ export interface TimeSeriesPoint {
   confidence?: number;
 }
 
+// Column-oriented series as returned by the API; lists are aligned by index
+export interface TimeSeriesColumns {
+  timestamp: (string | number)[];
+  excavated_area_ha: number[];
+  smoothed_area_ha: (number | null)[];
+  excavation_rate_ha_day: (number | null)[];
+  anomaly_score: (number | null)[];
+  confidence: (number | null)[];
+}
+
 export interface TimeSeriesResponse {
   aoi_id: string;
-  legal_boundary: TimeSeriesPoint[];
-  nogo_zones: TimeSeriesPoint[];
+  legal_boundary: TimeSeriesColumns;
+  nogo_zones: TimeSeriesColumns;
   summary_stats?: {
     total_excavated_ha?: number;
     average_rate_ha_day?: number;